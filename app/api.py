@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, Depends, UploadFile
+from fastapi import FastAPI, Depends, Query, UploadFile
 from pydantic import BaseModel, Field
 from typing import List
 
@@ -8,6 +8,7 @@ from app.services.infer import RiskModelService
 from app.models.db import get_session, engine
 from app.models import Base
 from app.models.jira import JiraIssue, JiraIssueCreate, JiraIssueRead
+from app.services.search import ensure_search_index, search_issues
 from sqlalchemy.orm import Session
 import csv
 
@@ -36,6 +37,18 @@ class PredictResponse(BaseModel):
     predictions: List[str]
 
 
+class JiraSearchHit(BaseModel):
+    issue: JiraIssueRead
+    score: float
+
+
+class JiraSearchResponse(BaseModel):
+    query: str
+    limit: int
+    offset: int
+    hits: List[JiraSearchHit]
+
+
 @app.get("/health")
 async def health() -> dict:
     return {"status": "ok"}
@@ -52,6 +65,7 @@ async def predict(req: PredictRequest) -> PredictResponse:
 @app.on_event("startup")
 def on_startup() -> None:
     Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
 
 
 # --- Jira endpoints ---
@@ -61,6 +75,22 @@ def list_issues(session: Session = Depends(get_session)) -> List[JiraIssueRead]:
     return [JiraIssueRead.model_validate(i) for i in issues]
 
 
+@app.get("/jira/search", response_model=JiraSearchResponse)
+def search(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10_000),
+    session: Session = Depends(get_session),
+) -> JiraSearchResponse:
+    hits = search_issues(session, q, limit=limit, offset=offset)
+    return JiraSearchResponse(
+        query=q,
+        limit=limit,
+        offset=offset,
+        hits=[JiraSearchHit(issue=JiraIssueRead.model_validate(i), score=s) for i, s in hits],
+    )
+
+
 @app.post("/jira/issues", response_model=JiraIssueRead)
 def create_issue(payload: JiraIssueCreate, session: Session = Depends(get_session)) -> JiraIssueRead:
     issue = JiraIssue(
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import numpy as np
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Base
+from app.models.jira import JiraIssue
+from app.services.search import ensure_search_index, search_issues
+
+COMMON_WORDS = ["portfolio", "risk", "model", "api", "dashboard", "data", "deploy", "fix"]
+SCRATCH_SCHEMA = "bench_search"
+
+
+@contextmanager
+def scratch_engine(database_url: str) -> Iterator[Engine]:
+    """Yield an engine whose issue table is a throwaway copy, never the real backlog.
+
+    Postgres runs in a dedicated schema that is dropped afterwards; SQLite runs in
+    a temporary database file.
+    """
+    if make_url(database_url).get_backend_name() == "postgresql":
+        admin = create_engine(database_url)
+        with admin.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE"))
+            conn.execute(text(f"CREATE SCHEMA {SCRATCH_SCHEMA}"))
+        engine = create_engine(
+            database_url, connect_args={"options": f"-csearch_path={SCRATCH_SCHEMA}"}
+        )
+        try:
+            yield engine
+        finally:
+            engine.dispose()
+            with admin.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE"))
+            admin.dispose()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        try:
+            yield engine
+        finally:
+            engine.dispose()
+
+
+def _issue_rows(
+    start: int, stop: int, vocab_size: int, rng: np.random.Generator
+) -> List[Dict[str, object]]:
+    # Rare terms are spread so each one matches roughly the same number of issues
+    # at every backlog size; common words pad the text like real tickets.
+    rare = rng.integers(0, vocab_size, size=(stop - start, 2))
+    common = rng.integers(0, len(COMMON_WORDS), size=(stop - start, 3))
+    rows: List[Dict[str, object]] = []
+    for k in range(stop - start):
+        words = [COMMON_WORDS[c] for c in common[k]]
+        rows.append(
+            {
+                "issue_type": "Story",
+                "summary": f"{words[0]} term{rare[k, 0]} {words[1]}",
+                "description": f"{words[2]} issue {start + k} mentions term{rare[k, 1]}",
+                "epic_link": None,
+                "priority": "Medium",
+            }
+        )
+    return rows
+
+
+def benchmark(
+    sizes: List[int], database_url: str, queries: int = 200, batch: int = 10_000
+) -> List[Dict[str, float]]:
+    rng = np.random.default_rng(settings.random_seed)
+    results: List[Dict[str, float]] = []
+    with scratch_engine(database_url) as engine:
+        Base.metadata.create_all(bind=engine)
+        ensure_search_index(engine)
+
+        loaded = 0
+        for size in sorted(sizes):
+            vocab_size = max(size // 50, 1)
+            with Session(engine) as session:
+                for start in range(loaded, size, batch):
+                    stop = min(start + batch, size)
+                    session.execute(insert(JiraIssue), _issue_rows(start, stop, vocab_size, rng))
+                session.commit()
+            loaded = size
+            if engine.dialect.name == "postgresql":
+                with engine.begin() as conn:
+                    conn.execute(text(f"ANALYZE {JiraIssue.__table__.name}"))
+
+            timings: List[float] = []
+            with Session(engine) as session:
+                for term in rng.integers(0, vocab_size, size=queries):
+                    t0 = time.perf_counter()
+                    search_issues(session, f"term{term}", limit=20)
+                    timings.append((time.perf_counter() - t0) * 1000)
+            results.append(
+                {
+                    "issues": size,
+                    "p50_ms": statistics.median(timings),
+                    "p95_ms": float(np.percentile(timings, 95)),
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark /jira/search latency by backlog size")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args()
+    print(f"backend: {make_url(args.database_url).get_backend_name()}")
+    for r in benchmark(args.sizes, args.database_url):
+        print(f"{r['issues']:>9,} issues  p50 {r['p50_ms']:7.2f} ms  p95 {r['p95_ms']:7.2f} ms")
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.jira import JiraIssue
+
+TABLE = JiraIssue.__table__.name
+FTS_TABLE = f"{TABLE}_fts"
+PG_INDEX = f"ix_{TABLE}_search"
+
+# Postgres only uses the GIN expression index when the query repeats it verbatim.
+PG_DOCUMENT = (
+    "to_tsvector('english', coalesce(summary, '') || ' ' || coalesce(description, ''))"
+)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+SUPPORTED_DIALECTS = ("sqlite", "postgresql")
+
+
+def _check_dialect(name: str) -> str:
+    if name not in SUPPORTED_DIALECTS:
+        raise RuntimeError(
+            f"Full-text search is not supported on '{name}' databases. "
+            f"Set DATABASE_URL to SQLite or Postgres."
+        )
+    return name
+
+
+def ensure_search_index(engine: Engine) -> None:
+    """Create the full-text index over issue summaries and descriptions.
+
+    SQLite gets an external-content FTS5 table kept in sync by triggers, Postgres
+    gets a GIN index on a tsvector expression. Either way every insert made by
+    ``create_issue`` or ``import_csv`` is indexed in the same transaction.
+    """
+    if _check_dialect(engine.dialect.name) == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(
+                text(f"CREATE INDEX IF NOT EXISTS {PG_INDEX} ON {TABLE} USING GIN ({PG_DOCUMENT})")
+            )
+        return
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+        conn.execute(
+            text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"summary, description, content='{TABLE}', content_rowid='id', "
+                "tokenize='porter unicode61')"
+            )
+        )
+        conn.execute(
+            text(
+                f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN "
+                f"INSERT INTO {FTS_TABLE}(rowid, summary, description) "
+                "VALUES (new.id, new.summary, new.description); END"
+            )
+        )
+        conn.execute(
+            text(
+                f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN "
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, summary, description) "
+                "VALUES ('delete', old.id, old.summary, old.description); END"
+            )
+        )
+        conn.execute(
+            text(
+                f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON {TABLE} BEGIN "
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, summary, description) "
+                "VALUES ('delete', old.id, old.summary, old.description); "
+                f"INSERT INTO {FTS_TABLE}(rowid, summary, description) "
+                "VALUES (new.id, new.summary, new.description); END"
+            )
+        )
+        if exists is None:
+            # Backfill issues created before the index existed.
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def _search_query(
+    dialect: str, terms: List[str], limit: int, offset: int
+) -> Tuple[TextClause, Dict[str, Any]]:
+    if _check_dialect(dialect) == "postgresql":
+        sql = text(
+            f"SELECT id, ts_rank({PG_DOCUMENT}, q) AS score "
+            f"FROM {TABLE}, plainto_tsquery('english', :q) AS q "
+            f"WHERE {PG_DOCUMENT} @@ q "
+            "ORDER BY score DESC, id DESC LIMIT :limit OFFSET :offset"
+        )
+        return sql, {"q": " ".join(terms), "limit": limit, "offset": offset}
+
+    # Quote every term so user input is never parsed as FTS5 query syntax;
+    # bm25() is lower-is-better, so negate it and weight summary hits higher.
+    sql = text(
+        f"SELECT rowid AS id, -bm25({FTS_TABLE}, 2.0, 1.0) AS score "
+        f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q "
+        "ORDER BY score DESC, id DESC LIMIT :limit OFFSET :offset"
+    )
+    match = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+    return sql, {"q": match, "limit": limit, "offset": offset}
+
+
+def search_issues(
+    session: Session, query: str, limit: int = 20, offset: int = 0
+) -> List[Tuple[JiraIssue, float]]:
+    """Return matching issues with their relevance score, best match first."""
+    terms = _TOKEN.findall(query)
+    if not terms:
+        return []
+
+    sql, params = _search_query(session.get_bind().dialect.name, terms, limit, offset)
+    ranked = session.execute(sql, params).all()
+    if not ranked:
+        return []
+    issues = {
+        i.id: i
+        for i in session.query(JiraIssue).filter(JiraIssue.id.in_([r.id for r in ranked]))
+    }
+    return [(issues[r.id], float(r.score)) for r in ranked if r.id in issues]
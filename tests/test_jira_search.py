@@ -0,0 +1,193 @@
+import io
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api import app
+from app.core.config import settings
+from app.models import Base
+from app.models.db import get_session
+from app.models.jira import JiraIssue
+from app.services.search import (
+    PG_INDEX,
+    _search_query,
+    ensure_search_index,
+    search_issues,
+)
+
+
+def _issue(summary: str, description: str | None = None) -> JiraIssue:
+    return JiraIssue(issue_type="Story", summary=summary, description=description, priority="High")
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine: Engine) -> Iterator[TestClient]:
+    ensure_search_index(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    def override_session() -> Iterator[Session]:
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_session] = override_session
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_session, None)
+
+
+def test_search_ranks_and_paginates(engine: Engine):
+    with Session(engine) as session:
+        # Created before the index exists, so it must be backfilled.
+        session.add(_issue("Build risk dashboard", "Streamlit GUI"))
+        session.commit()
+
+    ensure_search_index(engine)
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                _issue("Implement predict endpoint", "Risk predictions via FastAPI"),
+                _issue("Train risk classifier", "Risk model with risk metrics"),
+                _issue("Add CI workflow", "Ruff and pytest"),
+            ]
+        )
+        session.commit()
+
+        hits = search_issues(session, "risk")
+        assert len(hits) == 3
+        assert hits[0][0].summary == "Train risk classifier"
+        assert [s for _, s in hits] == sorted((s for _, s in hits), reverse=True)
+
+        page = search_issues(session, "risk", limit=1, offset=1)
+        assert [i.id for i, _ in page] == [hits[1][0].id]
+
+        assert search_issues(session, 'dashboard*') == search_issues(session, "dashboard")
+        assert search_issues(session, "   ") == []
+
+
+def test_search_follows_updates_and_deletes(engine: Engine):
+    ensure_search_index(engine)
+    with Session(engine) as session:
+        issue = _issue("Containerize services", "Dockerfile")
+        other = _issue("Add CI workflow", "Ruff and pytest")
+        session.add_all([issue, other])
+        session.commit()
+
+        issue.summary = "Deploy with compose"
+        session.commit()
+        assert search_issues(session, "containerize") == []
+        assert [i.id for i, _ in search_issues(session, "compose")] == [issue.id]
+
+        session.delete(other)
+        session.commit()
+        assert search_issues(session, "pytest") == []
+
+
+def test_unsupported_dialect_is_rejected():
+    with pytest.raises(RuntimeError, match="not supported on 'mysql'"):
+        _search_query("mysql", ["risk"], 20, 0)
+
+
+def test_search_endpoint_indexes_created_and_imported_issues(client: TestClient):
+    created = client.post(
+        "/jira/issues",
+        json={"issue_type": "Story", "summary": "Implement predict endpoint", "priority": "High"},
+    )
+    assert created.status_code == 200
+
+    resp = client.get("/jira/search", params={"q": "predict"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert set(body) == {"query", "limit", "offset", "hits"}
+    assert (body["query"], body["limit"], body["offset"]) == ("predict", 20, 0)
+    assert len(body["hits"]) == 1
+    assert set(body["hits"][0]) == {"issue", "score"}
+    assert body["hits"][0]["issue"]["id"] == created.json()["id"]
+
+    csv_data = (
+        "Issue Type,Summary,Description,Epic Link,Priority\n"
+        "Story,Build risk dashboard,Streamlit GUI,Dashboard,Medium\n"
+        "Story,Add CI workflow,Ruff and pytest,CI/CD,Medium\n"
+    )
+    imported = client.post(
+        "/jira/import", files={"file": ("issues.csv", io.BytesIO(csv_data.encode()), "text/csv")}
+    )
+    assert imported.json() == 2
+
+    hits = client.get("/jira/search", params={"q": "streamlit"}).json()["hits"]
+    assert [h["issue"]["summary"] for h in hits] == ["Build risk dashboard"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"q": ""},
+        {"q": "risk", "limit": 101},
+        {"q": "risk", "limit": 0},
+        {"q": "risk", "offset": -1},
+        {"q": "risk", "offset": 10_001},
+        {"q": "risk", "offset": 100000000000000000000},
+    ],
+)
+def test_search_endpoint_validates_params(client: TestClient, params: dict):
+    assert client.get("/jira/search", params=params).status_code == 422
+
+
+@pytest.mark.skipif(
+    make_url(settings.database_url).get_backend_name() != "postgresql",
+    reason="DATABASE_URL is not Postgres",
+)
+def test_postgres_search_uses_gin_index():
+    schema = "test_jira_search"
+    admin = create_engine(settings.database_url)
+    with admin.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(
+        settings.database_url, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    try:
+        Base.metadata.create_all(bind=engine)
+        ensure_search_index(engine)
+        with Session(engine) as session:
+            session.add_all(
+                [
+                    _issue("Train risk classifier", "Risk model with risk metrics"),
+                    _issue("Implement predict endpoint", "Risk predictions via FastAPI"),
+                    _issue("Add CI workflow", "Ruff and pytest"),
+                ]
+            )
+            session.commit()
+
+            hits = search_issues(session, "risk")
+            assert [i.summary for i, _ in hits] == [
+                "Train risk classifier",
+                "Implement predict endpoint",
+            ]
+            assert hits[0][1] > hits[1][1]
+
+            # The table is tiny, so forbid seq scans to see whether the index is usable at all.
+            session.execute(text("SET LOCAL enable_seqscan = off"))
+            sql, params = _search_query("postgresql", ["risk"], 20, 0)
+            plan = session.execute(text(f"EXPLAIN {sql.text}"), params).scalars().all()
+            assert any(PG_INDEX in line for line in plan), plan
+    finally:
+        engine.dispose()
+        with admin.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        admin.dispose()